@@ -2,13 +2,15 @@ import logging
 import os
 import plistlib
 import sys
+import time
+from collections import deque
 from dataclasses import dataclass
 from ctypes import c_void_p
 
 import cv2
 import mediapipe as mp
 import numpy as np
-from PyQt6.QtCore import QSettings, QTimer, Qt, QRect
+from PyQt6.QtCore import QEvent, QMutex, QSettings, QThread, QTimer, Qt, QRect
 from PyQt6.QtGui import QImage, QPixmap, QRegion
 from PyQt6.QtWidgets import (
     QApplication,
@@ -20,16 +22,354 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+try:
+    from numba import njit, prange
+    _NUMBA_OK = True
+except Exception:
+    _NUMBA_OK = False
+
+try:
+    from tflite_runtime.interpreter import Interpreter as TFLiteInterpreter
+    _TFLITE_OK = True
+except Exception:
+    _TFLITE_OK = False
+
+if sys.platform == "darwin":
+    try:
+        from AVFoundation import (
+            AVCaptureDevice,
+            AVMediaTypeVideo,
+            AVAuthorizationStatusAuthorized,
+            AVAuthorizationStatusDenied,
+            AVAuthorizationStatusNotDetermined,
+            AVAuthorizationStatusRestricted,
+        )
+        _AVF_OK = True
+    except Exception:
+        _AVF_OK = False
+else:
+    _AVF_OK = False
+
+SEG_MODEL_FILENAME = "selfie_segmentation_int8.tflite"
+
+
+if _NUMBA_OK:
+
+    @njit(parallel=True, cache=True)
+    def compose_rgba(rgb: np.ndarray, mask: np.ndarray, out: np.ndarray) -> None:
+        """Fused threshold + RGBA compose: one read of rgb/mask, one write of out."""
+        for i in prange(rgb.shape[0]):
+            for j in range(rgb.shape[1]):
+                out[i, j, 0] = rgb[i, j, 0]
+                out[i, j, 1] = rgb[i, j, 1]
+                out[i, j, 2] = rgb[i, j, 2]
+                out[i, j, 3] = 255 if mask[i, j] > 0.5 else 0
+
 
 @dataclass
 class AppConfig:
     width: int = 320
     height: int = 320
     blur_kernel: int = 21
+    seg_input_size: int = 256
     zoom_min: int = 100
     zoom_max: int = 300
 
 
+@dataclass
+class SegmentationResult:
+    segmentation_mask: np.ndarray
+
+
+class TFLiteSegmenter:
+    """Selfie segmentation via a quantized TFLite model.
+
+    Drop-in for the mediapipe solution: process() returns a result whose
+    segmentation_mask is float32 in [0, 1]. INT8 weights halve the bytes
+    moved per inference and use SIMD int8 dot products via XNNPACK.
+    """
+
+    def __init__(self, model_path: str, num_threads: int = 4) -> None:
+        self._interpreter = TFLiteInterpreter(model_path=model_path, num_threads=num_threads)
+        self._interpreter.allocate_tensors()
+        self._input = self._interpreter.get_input_details()[0]
+        self._output = self._interpreter.get_output_details()[0]
+        self._in_h = int(self._input["shape"][1])
+        self._in_w = int(self._input["shape"][2])
+        out_shape = self._output["shape"]
+        self._mask_out = np.empty((int(out_shape[1]), int(out_shape[2])), np.float32)
+
+    def process(self, rgb: np.ndarray) -> SegmentationResult:
+        if rgb.shape[0] != self._in_h or rgb.shape[1] != self._in_w:
+            rgb = cv2.resize(rgb, (self._in_w, self._in_h), interpolation=cv2.INTER_LINEAR)
+        dtype = self._input["dtype"]
+        if dtype == np.uint8:
+            data = rgb
+        elif dtype == np.int8:
+            scale, zero_point = self._input["quantization"]
+            data = np.clip(
+                np.round(rgb / (255.0 * scale) + zero_point), -128, 127
+            ).astype(np.int8)
+        else:
+            data = rgb.astype(np.float32) / 255.0
+        self._interpreter.set_tensor(self._input["index"], data[np.newaxis, ...])
+        self._interpreter.invoke()
+        out = self._interpreter.get_tensor(self._output["index"])[0]
+        if out.ndim == 3:
+            out = out[..., 0]
+        scale, zero_point = self._output["quantization"]
+        if scale:
+            np.subtract(out, zero_point, out=self._mask_out, dtype=np.float32)
+            np.multiply(self._mask_out, scale, out=self._mask_out)
+            mask = self._mask_out
+        else:
+            mask = np.ascontiguousarray(out, dtype=np.float32)
+        return SegmentationResult(segmentation_mask=mask)
+
+    def close(self) -> None:
+        self._interpreter = None
+
+
+class CaptureWorker(QThread):
+    """Reads camera frames off the Qt main thread.
+
+    Applies flip/zoom/resize and keeps the latest results in a small ring
+    buffer so the UI thread never blocks on cap.read().
+    """
+
+    def __init__(self, cap, target_size, parent=None) -> None:
+        super().__init__(parent)
+        self.cap = cap
+        self._target_size = target_size
+        self._zoom = 2.0
+        self._warp = None
+        self._crop_src = None
+        self._frames = deque(maxlen=2)
+        self._mutex = QMutex()
+        self._running = True
+        self._stale_caps = []
+        target_w, target_h = target_size
+        self._out_bufs = [
+            np.empty((target_h, target_w, 3), np.uint8),
+            np.empty((target_h, target_w, 3), np.uint8),
+        ]
+        self._out_idx = 0
+        self._use_opencl = cv2.ocl.haveOpenCL()
+
+    def set_capture(self, cap) -> None:
+        # The run loop may be blocked inside read() on the old handle, and
+        # releasing a capture concurrently with read() is undefined behavior
+        # on AVFoundation. Retired handles are queued here and released by
+        # the run loop itself between reads.
+        self._mutex.lock()
+        if self.cap is not None and self.cap is not cap:
+            self._stale_caps.append(self.cap)
+        self.cap = cap
+        self._frames.clear()
+        self._mutex.unlock()
+
+    def set_zoom(self, zoom: float) -> None:
+        self._zoom = zoom
+        self._crop_src = None
+
+    def latest(self):
+        self._mutex.lock()
+        frame = self._frames[-1] if self._frames else None
+        self._mutex.unlock()
+        return frame
+
+    def stop(self) -> None:
+        self._running = False
+        self.wait()
+
+    def run(self) -> None:
+        while self._running:
+            self._release_stale_caps()
+            cap = self.cap
+            if not cap or not cap.isOpened():
+                self.msleep(100)
+                continue
+            success, frame = cap.read()
+            if not success:
+                self.msleep(5)
+                continue
+            h, w = frame.shape[:2]
+            if self._crop_src != (w, h):
+                self._crop_src = (w, h)
+                self._warp = self._compute_warp(w, h)
+            out = self._transform(frame)
+            self._mutex.lock()
+            self._frames.append(out)
+            self._mutex.unlock()
+        self._release_stale_caps()
+
+    def _release_stale_caps(self) -> None:
+        self._mutex.lock()
+        stale = self._stale_caps
+        self._stale_caps = []
+        self._mutex.unlock()
+        for cap in stale:
+            if cap.isOpened():
+                cap.release()
+
+    def _transform(self, frame: np.ndarray) -> np.ndarray:
+        if self._use_opencl:
+            try:
+                gpu = cv2.warpAffine(
+                    cv2.UMat(frame),
+                    self._warp,
+                    self._target_size,
+                    flags=cv2.INTER_LINEAR,
+                    borderMode=cv2.BORDER_REPLICATE,
+                )
+                return gpu.get()
+            except cv2.error:
+                logging.exception("opencl warp failed; falling back to cpu")
+                self._use_opencl = False
+        out = self._out_bufs[self._out_idx]
+        self._out_idx ^= 1
+        cv2.warpAffine(
+            frame,
+            self._warp,
+            self._target_size,
+            dst=out,
+            flags=cv2.INTER_LINEAR,
+            borderMode=cv2.BORDER_REPLICATE,
+        )
+        return out
+
+    def _compute_warp(self, w: int, h: int) -> np.ndarray:
+        # One affine pass replaces flip -> center crop -> resize:
+        # dst_x = sx * (w - 1 - src_x - x1), dst_y = sy * (src_y - y1).
+        crop = self._compute_crop(w, h)
+        x1, y1, new_w, new_h = crop if crop else (0, 0, w, h)
+        sx = self._target_size[0] / new_w
+        sy = self._target_size[1] / new_h
+        return np.array(
+            [[-sx, 0.0, sx * (w - 1 - x1)], [0.0, sy, -sy * y1]],
+            dtype=np.float32,
+        )
+
+    def _compute_crop(self, w: int, h: int):
+        zoom = self._zoom
+        if zoom <= 1.0:
+            return None
+        new_w = max(1, int(w / zoom))
+        new_h = max(1, int(h / zoom))
+        x1 = (w - new_w) // 2
+        y1 = (h - new_h) // 2
+        return (x1, y1, new_w, new_h)
+
+
+class SegWorker(QThread):
+    """Runs selfie segmentation on the newest captured frame.
+
+    Publishes a finished RGBA frame so the UI thread only has to copy it to
+    the display buffer. Two output buffers alternate so a published frame is
+    not overwritten while the UI thread reads it.
+    """
+
+    def __init__(self, capture_worker: CaptureWorker, config: "AppConfig", parent=None) -> None:
+        super().__init__(parent)
+        self._capture_worker = capture_worker
+        self._segmenter = None
+        self._enabled = False
+        self._running = True
+        self._mutex = QMutex()
+        self._latest = None
+        self._last_frame = None
+        seg_size = config.seg_input_size
+        self._seg_size = seg_size
+        self._seg_in = np.empty((seg_size, seg_size, 3), np.uint8)
+        self._mask_up = np.empty((config.height, config.width), np.float32)
+        self._rgb_buf = np.empty((config.height, config.width, 3), np.uint8)
+        self._alpha_buf = np.empty((config.height, config.width), np.uint8)
+        self._rgba_bufs = [
+            np.empty((config.height, config.width, 4), np.uint8),
+            np.empty((config.height, config.width, 4), np.uint8),
+        ]
+        self._rgba_idx = 0
+        self._have_mask = False
+        self._seg_counter = 0
+        self._seg_stride = 1
+
+    def set_segmenter(self, segmenter) -> None:
+        self._segmenter = segmenter
+
+    def set_enabled(self, enabled: bool) -> None:
+        self._enabled = enabled
+
+    def latest(self):
+        self._mutex.lock()
+        pair = self._latest
+        self._mutex.unlock()
+        return pair
+
+    def stop(self) -> None:
+        self._running = False
+        self.wait()
+
+    def run(self) -> None:
+        while self._running:
+            segmenter = self._segmenter
+            if not self._enabled or segmenter is None:
+                self.msleep(30)
+                continue
+            frame = self._capture_worker.latest()
+            if frame is None or frame is self._last_frame:
+                self.msleep(3)
+                continue
+            self._last_frame = frame
+            try:
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+                self._seg_counter += 1
+                if not self._have_mask or self._seg_counter % self._seg_stride == 0:
+                    # On skipped ticks _mask_up still holds the previous mask;
+                    # adjacent frames are nearly identical, so reuse it when
+                    # inference is too slow for the frame rate.
+                    if not self._segment():
+                        continue
+                rgba_buf = self._rgba_bufs[self._rgba_idx]
+                self._rgba_idx ^= 1
+                self._compose(rgba_buf)
+                self._mutex.lock()
+                self._latest = rgba_buf
+                self._mutex.unlock()
+            except Exception:
+                logging.exception("segmentation worker failed")
+                self.msleep(30)
+
+    def _segment(self) -> bool:
+        cv2.resize(
+            self._rgb_buf,
+            (self._seg_size, self._seg_size),
+            dst=self._seg_in,
+            interpolation=cv2.INTER_LINEAR,
+        )
+        start = time.perf_counter()
+        results = self._segmenter.process(self._seg_in)
+        elapsed = time.perf_counter() - start
+        if elapsed > 0.028:
+            self._seg_stride = min(self._seg_stride + 1, 4)
+        elif elapsed < 0.014 and self._seg_stride > 1:
+            self._seg_stride -= 1
+        mask = results.segmentation_mask if results else None
+        if mask is None:
+            return self._have_mask
+        h, w = self._mask_up.shape
+        cv2.resize(mask, (w, h), dst=self._mask_up, interpolation=cv2.INTER_LINEAR)
+        self._have_mask = True
+        return True
+
+    def _compose(self, rgba_buf: np.ndarray) -> None:
+        if _NUMBA_OK:
+            compose_rgba(self._rgb_buf, self._mask_up, rgba_buf)
+            return
+        cv2.compare(self._mask_up, 0.5, cv2.CMP_GT, dst=self._alpha_buf)
+        rgba_buf[:, :, :3] = self._rgb_buf
+        rgba_buf[:, :, 3] = self._alpha_buf
+
+
 class CameraOverlay(QWidget):
     def __init__(self, config: AppConfig) -> None:
         super().__init__()
@@ -43,6 +383,10 @@ class CameraOverlay(QWidget):
         self.camera_error_message = None
         self._permission_requested = False
         self._open_retry_counter = 0
+        self._capture_fps = 0.0
+        self._last_debug_text = None
+        self._placeholder_cache = {}
+        self._last_zoom_text = ""
         self.debug_text_path = os.path.join(
             os.path.expanduser("~"),
             "Library",
@@ -69,6 +413,10 @@ class CameraOverlay(QWidget):
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.label.setFixedSize(self.config.width, self.config.height)
         self.label.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self._circle_region = QRegion(
+            QRect(0, 0, self.label.width(), self.label.height()),
+            QRegion.RegionType.Ellipse,
+        )
 
         self.controls = QWidget(self)
         self.controls.setObjectName("controls")
@@ -99,7 +447,7 @@ class CameraOverlay(QWidget):
         self.zoom_bar.setMinimum(self.config.zoom_min)
         self.zoom_bar.setMaximum(self.config.zoom_max)
         self.zoom_bar.setValue(200)
-        self.zoom_bar.setSingleStep(5)
+        self.zoom_bar.setSingleStep(10)
         self.zoom_bar.setPageStep(10)
         self.zoom_bar.valueChanged.connect(self.on_zoom_change)
         self.zoom_bar.setFocusPolicy(Qt.FocusPolicy.NoFocus)
@@ -141,18 +489,36 @@ class CameraOverlay(QWidget):
             self.cap = None
         self._configure_mediapipe_resource_dir()
         self.segmenter = None
+        self._rgba_buf = np.empty((self.config.height, self.config.width, 4), np.uint8)
+        self._rgba_image = QImage(
+            self._rgba_buf.data,
+            self.config.width,
+            self.config.height,
+            4 * self.config.width,
+            QImage.Format.Format_RGBA8888,
+        )
+        self.capture_worker = CaptureWorker(
+            self.cap, (self.config.width, self.config.height), self
+        )
+        self.capture_worker.start()
+        self.seg_worker = SegWorker(self.capture_worker, self.config, self)
+        self.seg_worker.start()
         self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.timer.timeout.connect(self.update_frame)
-        self.timer.start(33)
-
-        self.top_timer = QTimer(self)
-        self.top_timer.timeout.connect(self.ensure_on_top)
-        self.top_timer.start(1000)
+        self._start_frame_timer()
 
         self._load_settings()
         self.apply_shape_mask()
         self._position_controls_toggle_button()
 
+    def _start_frame_timer(self) -> None:
+        fps = self._capture_fps
+        if fps <= 0:
+            fps = 30.0
+        # Slightly under the frame interval so a fresh frame is always ready.
+        self.timer.start(max(10, int(1000 / fps) - 2))
+
     def move_to_top_center(self) -> None:
         screen = QApplication.primaryScreen()
         if not screen:
@@ -164,14 +530,19 @@ class CameraOverlay(QWidget):
 
     def apply_shape_mask(self) -> None:
         if self.shape == "circle":
-            region = QRegion(
-                QRect(0, 0, self.label.width(), self.label.height()),
-                QRegion.RegionType.Ellipse,
-            )
-            self.label.setMask(region)
+            self.label.setMask(self._circle_region)
         else:
             self.label.clearMask()
 
+    def event(self, e) -> bool:
+        if e.type() in (
+            QEvent.Type.ActivationChange,
+            QEvent.Type.WindowDeactivate,
+            QEvent.Type.ScreenChangeInternal,
+        ):
+            self.ensure_on_top()
+        return super().event(e)
+
     def keyPressEvent(self, event) -> None:
         key = event.key()
         if key in (Qt.Key.Key_Q, Qt.Key.Key_Escape):
@@ -217,43 +588,38 @@ class CameraOverlay(QWidget):
                 if self._open_retry_counter % 30 == 0:
                     self._ensure_camera_permission()
                     self.cap = self._open_camera()
+                    self.capture_worker.set_capture(self.cap)
+                    self._start_frame_timer()
                 self._render_placeholder(self.camera_error_message or "카메라를 열 수 없습니다.")
                 return
 
-            success, frame = self.cap.read()
-            if not success:
-                return
-
-            frame = cv2.flip(frame, 1)
-            target_w = self.label.width()
-            target_h = self.label.height()
-            frame = self._apply_zoom(frame)
-            frame = cv2.resize(frame, (target_w, target_h))
             if self.cutout_enabled:
                 if not self._ensure_segmenter_ready():
                     return
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                results = self.segmenter.process(rgb)
-                mask = results.segmentation_mask if results else None
-                if mask is None:
+                rgba = self.seg_worker.latest()
+                if rgba is None:
                     return
-                alpha = (mask > 0.5).astype(np.uint8) * 255
-                rgba = np.dstack((rgb, alpha))
-                h, w, ch = rgba.shape
-                bytes_per_line = ch * w
-                image = QImage(rgba.data, w, h, bytes_per_line, QImage.Format.Format_RGBA8888)
+                np.copyto(self._rgba_buf, rgba)
+                pixmap = QPixmap.fromImage(
+                    self._rgba_image, Qt.ImageConversionFlag.NoFormatConversion
+                )
             else:
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                h, w, ch = rgb.shape
+                frame = self.capture_worker.latest()
+                if frame is None:
+                    return
+                h, w, ch = frame.shape
                 bytes_per_line = ch * w
-                image = QImage(rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+                image = QImage(frame.data, w, h, bytes_per_line, QImage.Format.Format_BGR888)
+                pixmap = QPixmap.fromImage(image)
 
-            self.label.setPixmap(QPixmap.fromImage(image))
+            self.label.setPixmap(pixmap)
         except Exception:
             logging.exception("update_frame failed")
             self._render_placeholder("오류가 발생했습니다. 로그를 확인하세요.")
 
     def closeEvent(self, event) -> None:
+        self.seg_worker.stop()
+        self.capture_worker.stop()
         if self.cap and self.cap.isOpened():
             self.cap.release()
         if self.segmenter:
@@ -267,6 +633,7 @@ class CameraOverlay(QWidget):
         QTimer.singleShot(150, self.ensure_on_top)
 
     def _open_camera(self) -> cv2.VideoCapture:
+        self._capture_fps = 0.0
         if self._camera_permission_denied():
             self.camera_error_message = (
                 "Camera permission is off. Enable it in System Settings."
@@ -274,27 +641,32 @@ class CameraOverlay(QWidget):
             return None
         cap = cv2.VideoCapture(0, cv2.CAP_AVFOUNDATION)
         if cap.isOpened():
+            self._configure_capture(cap)
             return cap
         cap.release()
         fallback = cv2.VideoCapture(0)
         if not fallback.isOpened():
             self.camera_error_message = "Unable to access the camera."
             return None
+        self._configure_capture(fallback)
         return fallback
 
+    def _configure_capture(self, cap: cv2.VideoCapture) -> None:
+        # Smallest capture that still covers the deepest zoom crop of the
+        # label-sized view; anything larger is discarded by the downscale.
+        side = max(self.config.width, self.config.height) * self.config.zoom_max // 100
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, side)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, side)
+        cap.set(cv2.CAP_PROP_FPS, 30)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 2)
+        # Queried while this thread still owns the handle; once it is handed
+        # to the capture worker, property reads would race the worker's read().
+        self._capture_fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+
     def _ensure_camera_permission(self) -> None:
         if sys.platform != "darwin":
             return
-        try:
-            from AVFoundation import (
-                AVCaptureDevice,
-                AVMediaTypeVideo,
-                AVAuthorizationStatusAuthorized,
-                AVAuthorizationStatusDenied,
-                AVAuthorizationStatusNotDetermined,
-                AVAuthorizationStatusRestricted,
-            )
-        except Exception:
+        if not _AVF_OK:
             self.camera_error_message = (
                 "AVFoundation 모듈을 불러올 수 없습니다. 앱을 다시 빌드하세요."
             )
@@ -323,14 +695,7 @@ class CameraOverlay(QWidget):
     def _camera_permission_denied(self) -> bool:
         if sys.platform != "darwin":
             return False
-        try:
-            from AVFoundation import (
-                AVCaptureDevice,
-                AVMediaTypeVideo,
-                AVAuthorizationStatusDenied,
-                AVAuthorizationStatusRestricted,
-            )
-        except Exception:
+        if not _AVF_OK:
             self.camera_error_message = (
                 "AVFoundation 모듈을 불러올 수 없습니다. 앱을 다시 빌드하세요."
             )
@@ -351,19 +716,21 @@ class CameraOverlay(QWidget):
             self.cutout_enabled = True
         else:
             self.cutout_enabled = False
+        self.seg_worker.set_enabled(self.cutout_enabled)
         self.cutout_button.setText("배경 제거: ON" if self.cutout_enabled else "배경 제거: OFF")
         self._save_settings()
 
     def toggle_camera(self) -> None:
         if self.camera_enabled:
             self.camera_enabled = False
-            if self.cap and self.cap.isOpened():
-                self.cap.release()
+            self.capture_worker.set_capture(None)
             self.cap = None
         else:
             self.camera_enabled = True
             self._ensure_camera_permission()
             self.cap = self._open_camera()
+            self.capture_worker.set_capture(self.cap)
+            self._start_frame_timer()
         self.camera_button.setText("카메라: ON" if self.camera_enabled else "카메라: OFF")
         self._save_settings()
 
@@ -381,7 +748,11 @@ class CameraOverlay(QWidget):
 
     def on_zoom_change(self, value: int) -> None:
         zoom = value / 100.0
-        self.zoom_label.setText(f"줌 {zoom:.1f}x")
+        self.capture_worker.set_zoom(zoom)
+        text = f"줌 {zoom:.1f}x"
+        if text != self._last_zoom_text:
+            self._last_zoom_text = text
+            self.zoom_label.setText(text)
         self._save_settings()
 
     def _load_settings(self) -> None:
@@ -413,12 +784,14 @@ class CameraOverlay(QWidget):
         else:
             self.setFixedSize(self.controls_width, self.config.height)
 
+        self.seg_worker.set_enabled(self.cutout_enabled)
         if self.camera_enabled:
             self._ensure_camera_permission()
             self.cap = self._open_camera()
+            self.capture_worker.set_capture(self.cap)
+            self._start_frame_timer()
         else:
-            if self.cap and self.cap.isOpened():
-                self.cap.release()
+            self.capture_worker.set_capture(None)
             self.cap = None
 
         pos_x = self.settings.value("pos_x", None)
@@ -445,18 +818,6 @@ class CameraOverlay(QWidget):
         button_w = self.controls_toggle_button.sizeHint().width()
         self.controls_toggle_button.move(self.width() - button_w - margin, margin)
 
-    def _apply_zoom(self, frame: np.ndarray) -> np.ndarray:
-        zoom = self.zoom_bar.value() / 100.0
-        if zoom <= 1.0:
-            return frame
-        h, w = frame.shape[:2]
-        new_w = max(1, int(w / zoom))
-        new_h = max(1, int(h / zoom))
-        x1 = (w - new_w) // 2
-        y1 = (h - new_h) // 2
-        cropped = frame[y1 : y1 + new_h, x1 : x1 + new_w]
-        return cropped
-
     def _configure_mediapipe_resource_dir(self) -> None:
         if sys.platform != "darwin" or not getattr(sys, "frozen", False):
             return
@@ -482,6 +843,14 @@ class CameraOverlay(QWidget):
         if self.segmenter:
             return True
         try:
+            model_path = self._find_seg_model()
+            if _TFLITE_OK and model_path:
+                self.segmenter = TFLiteSegmenter(model_path)
+                logging.info("using quantized tflite segmenter: %s", model_path)
+                self._warm_compose_kernel()
+                self.seg_worker.set_segmenter(self.segmenter)
+                return True
+
             self._configure_mediapipe_resource_dir()
             if sys.platform == "darwin" and getattr(sys, "frozen", False):
                 resources_dir = os.path.abspath(os.path.join(sys.executable, "..", "..", "Resources"))
@@ -513,6 +882,8 @@ class CameraOverlay(QWidget):
                     return False
 
             self.segmenter = mp.solutions.selfie_segmentation.SelfieSegmentation(model_selection=1)
+            self._warm_compose_kernel()
+            self.seg_worker.set_segmenter(self.segmenter)
             return True
         except FileNotFoundError:
             self.camera_error_message = (
@@ -527,6 +898,29 @@ class CameraOverlay(QWidget):
             self._render_placeholder(self.camera_error_message)
             return False
 
+    def _find_seg_model(self) -> str | None:
+        candidate_dirs = [os.path.dirname(os.path.abspath(__file__))]
+        if sys.platform == "darwin" and getattr(sys, "frozen", False):
+            candidate_dirs = [
+                os.path.abspath(os.path.join(sys.executable, "..", "..", "Resources")),
+                os.path.abspath(os.path.join(sys.executable, "..", "..", "Frameworks")),
+            ] + candidate_dirs
+        for base_dir in candidate_dirs:
+            path = os.path.join(base_dir, SEG_MODEL_FILENAME)
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def _warm_compose_kernel(self) -> None:
+        if not _NUMBA_OK:
+            return
+        # Warm-compile the compose kernel off the per-frame path.
+        compose_rgba(
+            np.zeros((2, 2, 3), np.uint8),
+            np.zeros((2, 2), np.float32),
+            np.zeros((2, 2, 4), np.uint8),
+        )
+
     def _validate_camera_usage_description(self) -> bool:
         if sys.platform != "darwin":
             return True
@@ -558,24 +952,30 @@ class CameraOverlay(QWidget):
 
     def _render_placeholder(self, message: str) -> None:
         self._write_debug_text(message)
-        width = self.label.width()
-        height = self.label.height()
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
-        lines = message.splitlines() if message else ["error"]
-        y = 24
-        for line in lines[:6]:
-            cv2.putText(frame, line[:64], (10, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-            y += 26
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb.shape
-        bytes_per_line = ch * w
-        image = QImage(rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-        self.label.setPixmap(QPixmap.fromImage(image))
+        pixmap = self._placeholder_cache.get(message)
+        if pixmap is None:
+            width = self.label.width()
+            height = self.label.height()
+            frame = np.zeros((height, width, 3), dtype=np.uint8)
+            lines = message.splitlines() if message else ["error"]
+            y = 24
+            for line in lines[:6]:
+                cv2.putText(frame, line[:64], (10, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+                y += 26
+            h, w, ch = frame.shape
+            bytes_per_line = ch * w
+            image = QImage(frame.data, w, h, bytes_per_line, QImage.Format.Format_BGR888)
+            pixmap = QPixmap.fromImage(image)
+            self._placeholder_cache[message] = pixmap
+        self.label.setPixmap(pixmap)
 
     def _write_debug_text(self, message: str) -> None:
+        if message == self._last_debug_text:
+            return
         try:
             with open(self.debug_text_path, "w", encoding="utf-8") as handle:
                 handle.write(message or "")
+            self._last_debug_text = message
         except Exception:
             logging.exception("failed to write debug text")
 